@@ -0,0 +1,107 @@
+from typing import Any, Dict, List, Type, get_args, get_origin, Union
+from fastapi import FastAPI, Body, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, PydanticUserError, ValidationError
+from registry import TapRegistry
+
+registry = TapRegistry()
+
+tags_metadata = [
+    {
+        "name": "Registry",
+        "description": "List every Tap class and typed function found in `TAP_REGISTRY_MODULES`",
+    },
+    {
+        "name": "Submit",
+        "description": "Equivalent of `/submit` and `/test-tap-func` for any registered entry",
+    },
+]
+
+app = FastAPI(openapi_tags=tags_metadata)
+
+
+def _is_multi_value(annotation: Any) -> bool:
+    if get_origin(annotation) is Union:
+        return any(_is_multi_value(arg) for arg in get_args(annotation))
+    return get_origin(annotation) in {list, set, tuple}
+
+
+# Query string and form data are flat multi-dicts (e.g. ?items=a&items=b),
+# so collect repeated keys into a list for the fields that expect one
+def _collect_params(model: Type[BaseModel], params) -> Dict[str, Any]:
+    data = {}
+    for key in params.keys():
+        field = model.model_fields.get(key)
+        if field is not None and _is_multi_value(field.annotation):
+            data[key] = params.getlist(key)
+        else:
+            data[key] = params.get(key)
+    return data
+
+
+def _load_model(name: str) -> Type[BaseModel]:
+    try:
+        return registry.pydantic_model(name)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+    except (ImportError, AttributeError, TypeError) as e:
+        # Listed by the scanner but can't be loaded (or isn't a Tap after all)
+        raise HTTPException(status_code=404, detail=f"Cannot load {name}: {e!r}")
+    except (PydanticUserError, NameError) as e:
+        # Loaded, but its annotations can't be turned into a Pydantic model
+        raise HTTPException(status_code=422, detail=f"Cannot build model for {name}: {e!r}")
+
+
+# First access imports the target module, keep that off the event loop
+async def _get_model(name: str) -> Type[BaseModel]:
+    return await run_in_threadpool(_load_model, name)
+
+
+async def _validate_and_run(name: str, data: Dict[str, Any]) -> Any:
+    model_class = await _get_model(name)
+    try:
+        model = model_class.model_validate(data)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+    # Registered functions might be blocking
+    return await run_in_threadpool(registry.run, name, model)
+
+
+@app.get("/taps", tags=["Registry"])
+async def list_taps() -> List[Dict[str, str]]:
+    # Scanning the modules reads their source the first time
+    entries = await run_in_threadpool(lambda: registry.entries)
+    return [{"name": entry.name, "kind": entry.kind} for entry in entries.values()]
+
+
+@app.get("/taps/{name}/schema", tags=["Registry"])
+async def get_schema(name: str) -> Dict[str, Any]:
+    model_class = await _get_model(name)
+    try:
+        return model_class.model_json_schema()
+    except PydanticUserError as e:
+        raise HTTPException(status_code=422, detail=f"Cannot build schema for {name}: {e!r}")
+
+
+@app.get("/taps-cache", tags=["Registry"])
+async def get_cache_info() -> Dict[str, Any]:
+    return registry.cache_info()
+
+
+@app.post("/taps/{name}/submit", tags=["Submit"])
+async def submit_post(name: str, data: Dict[str, Any] = Body()):
+    return await _validate_and_run(name, data)
+
+
+@app.get("/taps/{name}/submit", tags=["Submit"])
+async def submit_get(name: str, request: Request):
+    return await _validate_and_run(
+        name, _collect_params(await _get_model(name), request.query_params)
+    )
+
+
+@app.post("/taps/{name}/submit-form", tags=["Submit"])
+async def submit_form(name: str, request: Request):
+    form = await request.form()
+    return await _validate_and_run(name, _collect_params(await _get_model(name), form))
@@ -1,6 +1,9 @@
 from typing import Optional, Literal, Dict, Any, List, Set, Tuple
 from tap import Tap, tapify
 
+# What registry.py exposes from this module (functions are only registered when listed)
+__taps__ = ["MyTap", "tap_func"]
+
 
 class MyTap(Tap):
     name: str
@@ -0,0 +1,299 @@
+import asyncio
+import itertools
+import json
+import math
+import os
+import socket
+import statistics
+import threading
+import time
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+import httpx
+from tap import Tap
+
+# (endpoint, mode) -> (HTTP method, path, how the payload is sent)
+ENDPOINTS: Dict[Tuple[str, str], Tuple[str, str, str]] = {
+    ("submit", "json"): ("POST", "/submit", "json"),
+    ("submit", "get"): ("GET", "/submit", "params"),
+    ("submit", "form"): ("POST", "/submit-form", "data"),
+    ("tap-func", "json"): ("POST", "/test-tap-func", "json"),
+    ("tap-func", "get"): ("GET", "/test-tap-func", "params"),
+}
+
+DEFAULT_PAYLOADS = [
+    {"name": "David", "age": 87},
+    {"name": "Alice", "age": 30, "choice": "Option2", "agree": True},
+    {"name": "Bob", "age": 42, "optional_field": "hello", "choice": "Option3"},
+]
+
+
+class LoadTestArgs(Tap):
+    payloads: Optional[str] = None  # JSON lines file, one payload per line
+    endpoints: List[Literal["submit", "tap-func"]] = ["submit", "tap-func"]
+    modes: List[Literal["json", "get", "form"]] = ["json", "get", "form"]
+    requests: int = 1000  # Total number of requests
+    concurrency: int = 10  # Number of in-flight requests
+    rate: Optional[float] = None  # Requests per second (None: as fast as possible)
+    server: Literal["asgi", "uvicorn", "url"] = "asgi"
+    url: str = "http://127.0.0.1:8888"  # Only used with `--server url`
+    streamlit: bool = False  # Also measure Streamlit rerun time with AppTest
+    streamlit_script: str = "ui_streamlit.py"
+    streamlit_iterations: int = 20
+
+
+def load_payloads(path: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Each line is either a payload itself, or `{"endpoint": ..., "mode": ..., "payload": {...}}`
+    to pin it to a specific endpoint / mode.
+    """
+    if path is None:
+        return [{"payload": payload} for payload in DEFAULT_PAYLOADS]
+    payloads = []
+    with open(path, encoding="utf-8") as fp:
+        for line in fp:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            payloads.append(item if "payload" in item else {"payload": item})
+    return payloads
+
+
+def build_plan(
+    payloads: List[Dict[str, Any]], endpoints: List[str], modes: List[str]
+) -> List[Tuple[Tuple[str, str], Dict[str, Any]]]:
+    plan = []
+    for item in payloads:
+        for key in itertools.product(endpoints, modes):
+            if key not in ENDPOINTS:
+                continue  # e.g. there is no form route for the function
+            if item.get("endpoint", key[0]) != key[0] or item.get("mode", key[1]) != key[1]:
+                continue
+            plan.append((key, item["payload"]))
+    if not plan:
+        raise ValueError("No (endpoint, mode, payload) combination to send.")
+    return plan
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    # Nearest-rank
+    if not sorted_values:
+        return float("nan")
+    index = max(0, min(len(sorted_values) - 1, math.ceil(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    values = sorted(latencies)
+    return {
+        "count": len(values) + errors,
+        "errors": errors,
+        "throughput": (len(values) + errors) / elapsed if elapsed else float("nan"),
+        "mean_ms": statistics.fmean(values) * 1000 if values else float("nan"),
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+        "max_ms": values[-1] * 1000 if values else float("nan"),
+    }
+
+
+def print_report(title: str, rows: Dict[str, Dict[str, float]]) -> None:
+    print(f"\n{title}")
+    columns = ["count", "errors", "throughput", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+    width = max(len(name) for name in rows)
+    print(f"{'':<{width}}  " + "  ".join(f"{column:>10}" for column in columns))
+    for name, row in rows.items():
+        print(
+            f"{name:<{width}}  "
+            + "  ".join(
+                f"{row[column]:>10d}" if isinstance(row[column], int) else f"{row[column]:>10.2f}"
+                for column in columns
+            )
+        )
+
+
+async def run_http_load(
+    client: httpx.AsyncClient,
+    plan: List[Tuple[Tuple[str, str], Dict[str, Any]]],
+    total: int,
+    concurrency: int,
+    rate: Optional[float],
+) -> Dict[str, Dict[str, float]]:
+    latencies: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    counter = itertools.count()
+    start = time.perf_counter()
+
+    async def worker():
+        while (i := next(counter)) < total:
+            if rate:
+                # Open-loop schedule: request i is due at start + i / rate.
+                # Latency counts from then, so time spent waiting for a free worker
+                # when falling behind is included (no coordinated omission)
+                sent = start + i / rate
+                delay = sent - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            else:
+                sent = time.perf_counter()
+            key, payload = plan[i % len(plan)]
+            method, path, send_as = ENDPOINTS[key]
+            name = f"{method} {path} ({key[1]})"
+            try:
+                response = await client.request(method, path, **{send_as: payload})
+                ok = response.is_success
+            except httpx.HTTPError:
+                ok = False
+            if ok:
+                latencies.setdefault(name, []).append(time.perf_counter() - sent)
+            else:
+                errors[name] = errors.get(name, 0) + 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    rows = {
+        name: summarize(latencies.get(name, []), errors.get(name, 0), elapsed)
+        for name in sorted(set(latencies) | set(errors))
+    }
+    rows["total"] = summarize(
+        list(itertools.chain.from_iterable(latencies.values())),
+        sum(errors.values()),
+        elapsed,
+    )
+    return rows
+
+
+def _get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_uvicorn(app) -> Tuple[str, Any]:
+    """Run the API in a background thread (stand-in backend for the UIs)."""
+    import uvicorn
+
+    port = _get_free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("uvicorn failed to start")
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}", server
+
+
+def _find_widget(widgets, label: str):
+    return next(widget for widget in widgets if widget.label == label)
+
+
+def run_streamlit_load(script: str, api_url: str, iterations: int) -> Dict[str, Dict[str, float]]:
+    """Time each rerun of the Streamlit form triggered by one user interaction."""
+    from streamlit.testing.v1 import AppTest
+
+    interactions = {
+        "initial run": lambda at: at,
+        "type name": lambda at: _find_widget(at.text_input, "name").input("David"),
+        "set age": lambda at: _find_widget(at.number_input, "age").set_value(87),
+        "toggle agree": lambda at: _find_widget(at.checkbox, "agree").check(),
+        "pick choice": lambda at: _find_widget(at.selectbox, "choice").select("Option2"),
+        "use default": lambda at: _find_widget(at.checkbox, "Use Default Value").check(),
+        "send POST JSON": lambda at: _find_widget(at.button, "Send POST JSON").click(),
+        "send GET": lambda at: _find_widget(at.button, "Send GET Request").click(),
+        "send POST form": lambda at: _find_widget(at.button, "Send POST Form").click(),
+    }
+    timings: Dict[str, List[float]] = {name: [] for name in interactions}
+    errors: Dict[str, int] = {name: 0 for name in interactions}
+
+    # Picked up by the Streamlit UIs when the script runs, restored afterwards
+    previous_api_base_url = os.environ.get("API_BASE_URL")
+    os.environ["API_BASE_URL"] = api_url
+
+    start = time.perf_counter()
+    try:
+        for _ in range(iterations):
+            at = AppTest.from_file(script, default_timeout=30)
+            for name, interact in interactions.items():
+                if name != "initial run" and at.exception:
+                    # Earlier rerun crashed, the widget tree can't be trusted
+                    errors[name] += 1
+                    continue
+                try:
+                    element = interact(at)
+                except StopIteration:
+                    errors[name] += 1
+                    continue
+                sent = time.perf_counter()
+                element.run()
+                # Like the HTTP load, failed reruns only count as errors
+                if at.exception or at.error:
+                    errors[name] += 1
+                else:
+                    timings[name].append(time.perf_counter() - sent)
+    finally:
+        if previous_api_base_url is None:
+            os.environ.pop("API_BASE_URL", None)
+        else:
+            os.environ["API_BASE_URL"] = previous_api_base_url
+    elapsed = time.perf_counter() - start
+
+    return {
+        name: summarize(timings[name], errors[name], elapsed)
+        for name in interactions
+    }
+
+
+def main(args: LoadTestArgs) -> None:
+    plan = build_plan(load_payloads(args.payloads), args.endpoints, args.modes)
+
+    app = None
+    if args.server != "url":
+        from api import app
+
+    server = None
+    backend_url = args.url
+    # Streamlit talks to the API through `requests`, so it needs a real socket
+    if args.server == "uvicorn" or (args.server == "asgi" and args.streamlit):
+        backend_url, server = start_uvicorn(app)
+
+    try:
+        if args.server == "asgi":
+            transport = httpx.ASGITransport(app=app)
+            client = httpx.AsyncClient(transport=transport, base_url="http://asgi")
+        else:
+            limits = httpx.Limits(max_connections=args.concurrency)
+            client = httpx.AsyncClient(base_url=backend_url, limits=limits)
+
+        async def run():
+            async with client:
+                return await run_http_load(
+                    client, plan, args.requests, args.concurrency, args.rate
+                )
+
+        print_report(
+            f"API ({args.server}, concurrency={args.concurrency}, rate={args.rate or 'max'})",
+            asyncio.run(run()),
+        )
+
+        if args.streamlit:
+            print_report(
+                f"Streamlit rerun ({args.streamlit_script}, {args.streamlit_iterations} sessions)",
+                run_streamlit_load(
+                    args.streamlit_script,
+                    backend_url,
+                    args.streamlit_iterations,
+                ),
+            )
+    finally:
+        if server is not None:
+            server.should_exit = True
+
+
+if __name__ == "__main__":
+    # python loadtest.py --concurrency 50 --requests 5000
+    # python loadtest.py --server uvicorn --rate 200 --streamlit
+    main(LoadTestArgs().parse_args())
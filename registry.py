@@ -0,0 +1,419 @@
+import ast
+import importlib
+import importlib.util
+import inspect
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+from tap import Tap
+from utils import (
+    create_flask_form_class,
+    create_pydantic_model,
+    create_pydantic_model_from_func,
+)
+
+# Comma separated module names to scan, e.g. "cli,my_project.configs"
+DEFAULT_MODULES = [
+    module.strip()
+    for module in os.environ.get("TAP_REGISTRY_MODULES", "cli").split(",")
+    if module.strip()
+]
+# Base classes are only followed into modules under this directory (or the scanned packages)
+PROJECT_ROOT = os.path.abspath(os.environ.get("TAP_REGISTRY_ROOT", os.getcwd()))
+# Max number of generated models / forms kept alive at the same time
+DEFAULT_CACHE_SIZE = int(os.environ.get("TAP_REGISTRY_CACHE_SIZE", "64"))
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RegistryEntry:
+    module: str
+    attr: str
+    kind: Literal["tap", "func"]
+
+    @property
+    def name(self) -> str:
+        return f"{self.module}:{self.attr}"
+
+
+# Where `Tap` itself lives, for `from tap import Tap`, `import tap` and `tap.tap.Tap`
+TAP_MODULES = {"tap", "tap.tap"}
+# Never worth reading the source of these to look for Tap subclasses
+SKIP_MODULES = set(getattr(sys, "stdlib_module_names", ())) | {"builtins"}
+
+
+def _read_source(module: str) -> Optional[Tuple[ast.Module, str]]:
+    """Parsed source and package of `module`, None if it has no readable `.py` source."""
+    spec = importlib.util.find_spec(module)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {module!r}")
+    if not (spec.origin and spec.origin.endswith(".py")):
+        return None
+    with open(spec.origin, encoding="utf-8") as fp:
+        tree = ast.parse(fp.read(), filename=spec.origin)
+    if spec.submodule_search_locations is not None:
+        return tree, module
+    return tree, module.rpartition(".")[0]
+
+
+def _dotted_name(node: ast.expr) -> Optional[str]:
+    if isinstance(node, ast.Subscript):
+        # class A(Base[int])
+        return _dotted_name(node.value)
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = _dotted_name(node.value)
+        return f"{value}.{node.attr}" if value else None
+    return None
+
+
+def _listed_names(tree: ast.Module) -> Optional[List[str]]:
+    """Names in a module level `__taps__ = [...]`, None if there is none."""
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and any(isinstance(target, ast.Name) and target.id == "__taps__" for target in node.targets)
+            and isinstance(node.value, (ast.List, ast.Tuple))
+        ):
+            return [
+                element.value
+                for element in node.value.elts
+                if isinstance(element, ast.Constant) and isinstance(element.value, str)
+            ]
+    return None
+
+
+@dataclass
+class _ModuleScan:
+    # Top level class -> True (Tap subclass), False (not one) or None (can't tell without importing)
+    classes: Dict[str, Optional[bool]]
+    # Local name -> (module, attribute), attribute is None for `import module`
+    imports: Dict[str, Tuple[str, Optional[str]]]
+    star_imports: List[str]
+    functions: List[str]
+    listed: Optional[List[str]]
+
+
+class _Scanner:
+    """
+    Tells Tap subclasses apart by following base classes through imports, without importing anything.
+
+    Bases are only followed into the scanned packages and modules under `PROJECT_ROOT`, since
+    locating `pkg.sub` imports `pkg` (think `torch.nn.Module`). Bases that can't be resolved this
+    way (third party, no source, import cycles, dynamic bases, ...) make the class a candidate,
+    which `TapRegistry.load` confirms with `issubclass` on first access.
+    """
+
+    def __init__(self, modules: Optional[List[str]] = None):
+        self._roots = {module.split(".")[0] for module in modules or []}
+        self._followable: Dict[str, bool] = {}
+        self._scans: Dict[str, Optional[_ModuleScan]] = {}
+        self._scanning = set()
+
+    def is_followable(self, module: str) -> bool:
+        top = module.split(".")[0]
+        if top in self._roots:
+            return True
+        if top not in self._followable:
+            # Locating a top level module doesn't import anything
+            try:
+                spec = importlib.util.find_spec(top)
+            except (ImportError, ValueError):
+                spec = None
+            origin = None
+            if spec is not None:
+                origin = spec.origin or next(iter(spec.submodule_search_locations or []), None)
+            self._followable[top] = (
+                origin is not None
+                and os.path.abspath(origin).startswith(PROJECT_ROOT + os.sep)
+                and not {"site-packages", "dist-packages"} & set(origin.split(os.sep))
+            )
+        return self._followable[top]
+
+    def scan(self, module: str) -> Optional[_ModuleScan]:
+        if module in self._scans:
+            return self._scans[module]
+        if module in self._scanning:
+            # Import cycle, can't tell yet
+            return None
+        self._scanning.add(module)
+        try:
+            source = _read_source(module)
+            result = None if source is None else self._scan_tree(*source)
+        finally:
+            self._scanning.discard(module)
+        self._scans[module] = result
+        return result
+
+    def is_tap(self, module: str, attr: str) -> Optional[bool]:
+        if module in TAP_MODULES:
+            return attr == "Tap"
+        if module.split(".")[0] in SKIP_MODULES:
+            return False
+        if not self.is_followable(module):
+            return None
+        try:
+            scan = self.scan(module)
+        except (ImportError, SyntaxError, ValueError, OSError):
+            return None
+        if scan is None:
+            return None
+        return self._lookup(scan, attr)
+
+    def _lookup(self, scan: _ModuleScan, name: str) -> Optional[bool]:
+        if name in scan.classes:
+            return scan.classes[name]
+        if name in scan.imports:
+            module, attr = scan.imports[name]
+            # A module is not a class
+            return False if attr is None else self.is_tap(module, attr)
+        verdicts = [self.is_tap(module, name) for module in scan.star_imports]
+        if True in verdicts:
+            return True
+        return None if None in verdicts else False
+
+    def _base_verdict(self, scan: _ModuleScan, base: ast.expr) -> Optional[bool]:
+        dotted = _dotted_name(base)
+        if dotted is None:
+            return None
+        head, _, rest = dotted.partition(".")
+        if not rest:
+            return self._lookup(scan, head)
+        if head not in scan.imports:
+            return False
+        # tap.Tap, configs.base.BaseArgs, ...
+        module, attr = scan.imports[head]
+        parts = [module] + ([attr] if attr else []) + rest.split(".")
+        return self.is_tap(".".join(parts[:-1]), parts[-1])
+
+    def _scan_tree(self, tree: ast.Module, package: str) -> _ModuleScan:
+        scan = _ModuleScan({}, {}, [], [], _listed_names(tree))
+        for node in tree.body:
+            if isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                if node.level:
+                    try:
+                        module = importlib.util.resolve_name("." * node.level + module, package)
+                    except ImportError:
+                        continue
+                for alias in node.names:
+                    if alias.name == "*":
+                        scan.star_imports.append(module)
+                    else:
+                        scan.imports[alias.asname or alias.name] = (module, alias.name)
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname:
+                        scan.imports[alias.asname] = (alias.name, None)
+                    else:
+                        # `import a.b` binds `a`
+                        head = alias.name.split(".")[0]
+                        scan.imports[head] = (head, None)
+            elif isinstance(node, ast.ClassDef):
+                verdicts = [self._base_verdict(scan, base) for base in node.bases]
+                if True in verdicts:
+                    scan.classes[node.name] = True
+                elif None in verdicts:
+                    scan.classes[node.name] = None
+                else:
+                    scan.classes[node.name] = False
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                scan.functions.append(node.name)
+        return scan
+
+    def entries(self, module: str) -> Optional[List[RegistryEntry]]:
+        """
+        Every Tap subclass (or candidate) of `module`, and functions only if listed in `__taps__`.
+        When `__taps__` is defined, only the names in it are registered.
+        """
+        scan = self.scan(module)
+        if scan is None:
+            return None
+        if scan.listed is None:
+            return [
+                RegistryEntry(module, name, "tap")
+                for name, verdict in scan.classes.items()
+                if verdict is not False
+            ]
+        entries = []
+        for name in scan.listed:
+            if name in scan.functions:
+                entries.append(RegistryEntry(module, name, "func"))
+            elif self._lookup(scan, name) is not False:
+                entries.append(RegistryEntry(module, name, "tap"))
+            elif name in scan.imports:
+                # Re-exported function
+                entries.append(RegistryEntry(module, name, "func"))
+        return entries
+
+
+def _scan_imported(module: str) -> List[RegistryEntry]:
+    """Fallback for modules without readable source (namespace packages, .so, ...)."""
+    entries = []
+    mod = importlib.import_module(module)
+    listed = getattr(mod, "__taps__", None)
+    for attr, obj in vars(mod).items():
+        if listed is not None and attr not in listed:
+            continue
+        if listed is None and (attr.startswith("_") or getattr(obj, "__module__", None) != module):
+            continue
+        if inspect.isclass(obj) and issubclass(obj, Tap):
+            entries.append(RegistryEntry(module, attr, "tap"))
+        elif listed is not None and callable(obj):
+            entries.append(RegistryEntry(module, attr, "func"))
+    return entries
+
+
+def discover(module: str, scanner: Optional[_Scanner] = None) -> List[RegistryEntry]:
+    scanner = _Scanner([module]) if scanner is None else scanner
+    entries = scanner.entries(module)
+    if entries is None:
+        return _scan_imported(module)
+    return entries
+
+
+class TapRegistry:
+    """
+    Catalog of Tap classes and typed functions spread over many modules.
+
+    Modules are only scanned (not imported) when the catalog is first listed,
+    a module is imported when one of its entries is first accessed, and the
+    generated Pydantic models / Flask forms are kept in a bounded LRU cache.
+    """
+
+    def __init__(
+        self,
+        modules: Optional[List[str]] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.modules = list(DEFAULT_MODULES if modules is None else modules)
+        self.cache_size = cache_size
+        # Module -> error message, for modules that couldn't be scanned
+        self.failed_modules: Dict[str, str] = {}
+        self._entries: Optional[Dict[str, RegistryEntry]] = None
+        self._entries_lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        # One lock per artifact being built, so a slow import doesn't block cache hits
+        self._build_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+    @property
+    def entries(self) -> Dict[str, RegistryEntry]:
+        if self._entries is not None:
+            return self._entries
+        with self._entries_lock:
+            if self._entries is None:
+                scanner = _Scanner(self.modules)
+                entries = {}
+                for module in self.modules:
+                    # One broken module shouldn't hide the rest of the catalog
+                    try:
+                        module_entries = discover(module, scanner)
+                    except Exception as e:
+                        logger.warning("Failed to scan module %s: %r", module, e)
+                        self.failed_modules[module] = repr(e)
+                        continue
+                    entries.update((entry.name, entry) for entry in module_entries)
+                self._entries = entries
+            return self._entries
+
+    def names(self, kind: Optional[Literal["tap", "func"]] = None) -> List[str]:
+        return [
+            name
+            for name, entry in self.entries.items()
+            if kind is None or entry.kind == kind
+        ]
+
+    def get_entry(self, name: str) -> RegistryEntry:
+        try:
+            return self.entries[name]
+        except KeyError:
+            raise KeyError(f"Unknown Tap or function {name!r}.") from None
+
+    def load(self, name: str) -> Union[Type[Tap], Callable[..., Any]]:
+        entry = self.get_entry(name)
+        obj = getattr(importlib.import_module(entry.module), entry.attr)
+        # Candidates found by the scanner are only confirmed here
+        if entry.kind == "tap" and not (inspect.isclass(obj) and issubclass(obj, Tap)):
+            raise TypeError(f"{name} is not a Tap subclass.")
+        if entry.kind == "func" and not callable(obj):
+            raise TypeError(f"{name} is not callable.")
+        return obj
+
+    def _get_cached(self, key: Tuple[str, str]) -> Tuple[bool, Any]:
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return True, self._cache[key]
+            return False, None
+
+    def _get_or_build(self, artifact: str, name: str, builder: Callable[[Any], Any]):
+        key = (artifact, name)
+        found, value = self._get_cached(key)
+        if found:
+            return value
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            # Someone else might have built it while we were waiting
+            found, value = self._get_cached(key)
+            if found:
+                return value
+            try:
+                value = builder(self.load(name))
+                with self._lock:
+                    self._cache[key] = value
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+            finally:
+                with self._lock:
+                    self._build_locks.pop(key, None)
+            return value
+
+    def pydantic_model(self, name: str) -> Type[BaseModel]:
+        if self.get_entry(name).kind == "tap":
+            return self._get_or_build("pydantic", name, create_pydantic_model)
+        return self._get_or_build("pydantic", name, create_pydantic_model_from_func)
+
+    def flask_form_class(self, name: str):
+        return self._get_or_build("flask", name, create_flask_form_class)
+
+    def run(self, name: str, model: BaseModel) -> Any:
+        """Tap classes echo back the validated arguments, functions get called."""
+        if self.get_entry(name).kind == "tap":
+            return model
+        return self.load(name)(**model.model_dump())
+
+    def evict(self, name: Optional[str] = None) -> None:
+        with self._lock:
+            if name is None:
+                self._cache.clear()
+                return
+            for key in [key for key in self._cache if key[1] == name]:
+                del self._cache[key]
+
+    def cache_info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "max_size": self.cache_size,
+                "keys": [f"{artifact}:{name}" for artifact, name in self._cache],
+                "failed_modules": dict(self.failed_modules),
+            }
+
+
+if __name__ == "__main__":
+    registry = TapRegistry()
+    print(registry.names())
+    print(model := registry.pydantic_model("cli:MyTap"))
+    print(model(name="David", age=87).model_dump_json())
+    print(registry.run("cli:tap_func", registry.pydantic_model("cli:tap_func")(name="David", age=87)))
+    print(registry.cache_info())
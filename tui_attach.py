@@ -0,0 +1,75 @@
+"""
+Per session command for Textual Web (see `serve.toml`), kept stdlib only so it skips the Textual / requests imports.
+
+It hands its stdin / stdout / stderr and environment over to a pre-imported worker of `tui_pool.py`
+and waits for the session to finish.
+"""
+
+import json
+import os
+import signal
+import socket
+import sys
+
+SOCKET_PATH = os.environ.get("TUI_POOL_SOCKET", "/tmp/tui_pool.sock")
+
+
+def attach(socket_path: str = SOCKET_PATH) -> int:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError as e:
+        print(f"Cannot connect to TUI pool at {socket_path}: {e}", file=sys.stderr)
+        return 1
+
+    worker_pid = None
+    received_signal = None
+
+    # The worker is in its own session, so pass on whatever is meant to stop us
+    def forward(signum, frame):
+        nonlocal received_signal
+        received_signal = signum
+        if worker_pid is not None:
+            try:
+                os.kill(worker_pid, signum)
+            except OSError:
+                pass
+
+    for signum in (signal.SIGTERM, signal.SIGHUP, signal.SIGINT):
+        signal.signal(signum, forward)
+
+    status = ""
+    with sock:
+        payload = json.dumps({"env": dict(os.environ), "cwd": os.getcwd()}).encode()
+        try:
+            socket.send_fds(sock, [len(payload).to_bytes(4, "big")], [0, 1, 2])
+            sock.sendall(payload)
+        except OSError:
+            # A refused session is closed right away, its reason can still be read below
+            pass
+
+        # "pid <worker pid>" when the session starts, then "exit <code>" once it is over,
+        # or "error <message>" if it was refused
+        try:
+            for line in sock.makefile("r"):
+                kind, _, value = line.strip().partition(" ")
+                if kind != "pid":
+                    status = line.strip()
+                    break
+                worker_pid = int(value)
+                if received_signal is not None:
+                    forward(received_signal, None)
+        except OSError:
+            pass
+
+    kind, _, value = status.partition(" ")
+    if kind == "exit":
+        return int(value)
+    if received_signal is not None:
+        return 128 + received_signal
+    print(f"TUI pool: {value or 'connection closed'}", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(attach())
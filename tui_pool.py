@@ -0,0 +1,276 @@
+import importlib
+import json
+import os
+import selectors
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from tap import Tap
+from tui_attach import SOCKET_PATH
+
+
+class TUIPoolArgs(Tap):
+    socket_path: str = SOCKET_PATH
+    pool_size: int = 4  # Pre-forked workers kept warm while sessions are coming in
+    min_idle: int = 1  # Never reap below this number of idle workers
+    idle_timeout: float = 300.0  # Seconds before an extra idle worker is reaped
+    max_sessions: int = 32  # Refuse new sessions above this
+
+
+@dataclass
+class Worker:
+    pid: int
+    channel: socket.socket
+    idle_since: float = field(default_factory=time.monotonic)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Client closed the connection during handoff")
+        data += chunk
+    return data
+
+
+def _exit_on_hangup(conn: socket.socket) -> None:
+    # tui_attach.py never sends anything after the handoff, so EOF means it is gone (even if SIGKILLed)
+    try:
+        conn.recv(1)
+    except OSError:
+        pass
+    os.kill(os.getpid(), signal.SIGTERM)
+
+
+def _run_session(conn: socket.socket) -> int:
+    header, stdio_fds, _, _ = socket.recv_fds(conn, 4, 3)
+    handoff = json.loads(_recv_exact(conn, int.from_bytes(header, "big")))
+    # So tui_attach.py can forward the signals it gets
+    conn.sendall(f"pid {os.getpid()}\n".encode())
+    threading.Thread(target=_exit_on_hangup, args=(conn,), daemon=True).start()
+
+    # Become the client process: its terminal, environment and working directory
+    for target, fd in enumerate(stdio_fds):
+        os.dup2(fd, target)
+        os.close(fd)
+    os.environ.clear()
+    os.environ.update(handoff["env"])
+    os.chdir(handoff["cwd"])
+
+    # TEXTUAL_DRIVER etc. (set by textual-web) are read at import time
+    import textual.constants
+
+    importlib.reload(textual.constants)
+
+    from tui import FastAPIRequestTester
+
+    app = FastAPIRequestTester()
+    app.run()
+    return app.return_code or 0
+
+
+def _worker_main(channel: socket.socket) -> int:
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    # Block until the pool hands over a session (or closes the channel to reap us)
+    _, fds, _, _ = socket.recv_fds(channel, 1, 1)
+    if not fds:
+        return 0
+
+    conn = socket.socket(fileno=fds[0])
+    try:
+        code = _run_session(conn)
+    except Exception:
+        traceback.print_exc()
+        code = 1
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        conn.sendall(f"exit {code}\n".encode())
+    except OSError:
+        pass
+    return code
+
+
+class TUIPool:
+    """
+    Pre-forked pool of TUI workers for Textual Web.
+
+    Everything `tui.py` needs is imported once in this process and inherited by the forked workers,
+    so a new session only pays for `tui_attach.py` and handing over its file descriptors.
+    Each worker serves a single session and exits, since a Textual App can't be run twice.
+    """
+
+    def __init__(self, args: TUIPoolArgs):
+        self.args = args
+        self.idle: List[Worker] = []
+        self.sessions: Dict[int, Worker] = {}
+        self.selector = selectors.DefaultSelector()
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    def preload(self) -> None:
+        import tui  # noqa: F401 (textual, requests, ...)
+
+        try:
+            importlib.import_module("textual.drivers.web_driver")
+        except ImportError:
+            pass
+
+    def spawn(self) -> None:
+        # Otherwise the worker inherits our pending output and flushes it into the session's stdout
+        sys.stdout.flush()
+        sys.stderr.flush()
+        parent_channel, child_channel = socket.socketpair()
+        pid = os.fork()
+        if pid == 0:
+            # Own session / process group, so a Ctrl-C on the pool doesn't kill running sessions
+            os.setsid()
+            # Only keep our own channel, otherwise closing a sibling's channel won't reap it
+            parent_channel.close()
+            self.selector.close()
+            self.listener.close()
+            for worker in self.idle:
+                worker.channel.close()
+            for worker in self.sessions.values():
+                worker.channel.close()
+            code = 1
+            try:
+                code = _worker_main(child_channel)
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                # Never fall back into the pool's loop from a worker
+                os._exit(code)
+        child_channel.close()
+        self.idle.append(Worker(pid, parent_channel))
+
+    def reap_children(self) -> None:
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            worker = self.sessions.pop(pid, None)
+            if worker is not None:
+                worker.channel.close()
+            else:
+                # Idle worker died on its own
+                for worker in [worker for worker in self.idle if worker.pid == pid]:
+                    worker.channel.close()
+                    self.idle.remove(worker)
+
+    def reap_idle(self) -> None:
+        now = time.monotonic()
+        # Oldest first, keep `min_idle` of them
+        while (
+            len(self.idle) > self.args.min_idle
+            and now - self.idle[0].idle_since > self.args.idle_timeout
+        ):
+            # Closing the channel makes the worker exit, waitpid() collects it
+            self.idle.pop(0).channel.close()
+
+    def replenish(self) -> None:
+        while len(self.idle) < self.args.pool_size:
+            try:
+                self.spawn()
+            except OSError as e:
+                # e.g. fork() hitting a process limit, try again on the next session
+                print(f"Failed to fork a TUI worker: {e!r}")
+                return
+
+    def _hand_over(self, conn: socket.socket) -> Optional[Worker]:
+        # Every idle worker, plus one freshly forked if they all turn out to be dead
+        for _ in range(len(self.idle) + 1):
+            if not self.idle:
+                try:
+                    self.spawn()
+                except OSError as e:
+                    print(f"Failed to fork a TUI worker: {e!r}")
+                    return None
+            worker = self.idle.pop()  # Most recently forked
+            try:
+                socket.send_fds(worker.channel, [b"s"], [conn.fileno()])
+            except OSError:
+                # Died since the last reap_children(), waitpid() collects it later
+                worker.channel.close()
+                continue
+            return worker
+        return None
+
+    def _refuse(self, conn: socket.socket, reason: str) -> None:
+        try:
+            conn.sendall(f"error {reason}\n".encode())
+            conn.shutdown(socket.SHUT_WR)
+            # Drop the handoff that is already there, so closing doesn't reset the connection
+            # before the client reads the reason (without blocking the pool on a slow client)
+            conn.setblocking(False)
+            while conn.recv(65536):
+                pass
+        except OSError:
+            # Client already gone, or nothing more to drain
+            pass
+
+    def handle(self, conn: socket.socket) -> None:
+        with conn:
+            if len(self.sessions) >= self.args.max_sessions:
+                self._refuse(conn, "too many sessions")
+                return
+            worker = self._hand_over(conn)
+            if worker is None:
+                self._refuse(conn, "no TUI worker available")
+                return
+            self.sessions[worker.pid] = worker
+        print(f"Session started (pid={worker.pid}, sessions={len(self.sessions)})")
+
+    def serve_forever(self) -> None:
+        self.preload()
+
+        if os.path.exists(self.args.socket_path):
+            os.unlink(self.args.socket_path)
+        self.listener.bind(self.args.socket_path)
+        self.listener.listen()
+        self.selector.register(self.listener, selectors.EVENT_READ)
+
+        self.replenish()
+        print(f"TUI pool listening on {self.args.socket_path} ({len(self.idle)} workers)")
+
+        try:
+            while True:
+                if self.selector.select(timeout=1.0):
+                    try:
+                        conn, _ = self.listener.accept()
+                    except OSError:
+                        # Client gave up before we got to it
+                        conn = None
+                    if conn is not None:
+                        self.handle(conn)
+                        self.replenish()
+                self.reap_children()
+                self.reap_idle()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # Running sessions (in their own process groups) are left alone, only the idle workers are stopped
+            for worker in self.idle:
+                worker.channel.close()
+            self.selector.close()
+            self.listener.close()
+            os.unlink(self.args.socket_path)
+
+
+if __name__ == "__main__":
+    # python tui_pool.py --pool_size 4 --max_sessions 32
+    # textual-web --config serve.toml
+    if not hasattr(os, "fork"):
+        sys.exit("tui_pool.py needs os.fork() and Unix domain sockets.")
+    TUIPool(TUIPoolArgs().parse_args()).serve_forever()
@@ -0,0 +1,65 @@
+from flask import Flask, render_template, abort, flash
+import requests
+import os
+from registry import TapRegistry
+
+app = Flask(__name__)
+app.secret_key = "your_secret_key"  # Change this to a more secure key
+
+# FastAPI endpoint URL (of api_registry.py)
+API_URL = os.environ.get("API_BASE_URL", "http://127.0.0.1:8888") + "/taps"
+
+registry = TapRegistry()
+
+SUBMIT_FIELDS = {"submit_json", "submit_get", "submit_form"}
+
+
+@app.route("/")
+def index():
+    return render_template("registry.html", names=registry.names())
+
+
+@app.route("/<name>", methods=["GET", "POST"])
+def tap_form(name: str):
+    try:
+        DataForm = registry.flask_form_class(name)
+    except (KeyError, ImportError, AttributeError, TypeError, NameError):
+        # Unknown, or listed by the scanner but can't be loaded
+        abort(404)
+
+    form = DataForm()
+    response_data = None
+
+    if form.validate_on_submit():
+        data = {
+            field.name: field.data
+            for field in form
+            if field.name not in SUBMIT_FIELDS and field.type != "CSRFTokenField"
+        }
+
+        submit_url = f"{API_URL}/{name}/submit"
+        if form.submit_json.data:
+            response = requests.post(submit_url, json=data)
+        elif form.submit_get.data:
+            response = requests.get(submit_url, params=data)
+        elif form.submit_form.data:
+            response = requests.post(f"{submit_url}-form", data=data)
+
+        if response.ok:
+            response_data = response.json()
+        else:
+            flash("Failed to get response from API", "danger")
+    elif form.is_submitted():
+        flash("Some fields are invalid, see below.", "danger")
+
+    return render_template(
+        "registry.html",
+        names=registry.names(),
+        name=name,
+        form=form,
+        response_data=response_data,
+    )
+
+
+if __name__ == "__main__":
+    app.run(debug=True)
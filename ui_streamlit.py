@@ -2,9 +2,10 @@ import streamlit as st
 from utils import create_streamlit_ui, create_pydantic_model
 from cli import MyTap
 import requests
+import os
 
 # FastAPI endpoint URL
-API_URL = "http://127.0.0.1:8888/submit"
+API_URL = os.environ.get("API_BASE_URL", "http://127.0.0.1:8888") + "/submit"
 
 st.set_page_config("Streamlit Tap Converter")
 st.title("Streamlit Tap Converter")
@@ -51,17 +52,27 @@ with local_tap:
     if st.button("Continue", disabled=bool(empty_args) and not allow_empty):
         st.text("You continued!")
 
+# Sets (and tuples) are not JSON serializable, and the GET endpoint expects comma separated lists
+json_inputs = {
+    name: list(value) if isinstance(value, (set, tuple)) else value
+    for name, value in inputs.items()
+}
+query_inputs = {
+    name: ",".join(map(str, value)) if isinstance(value, (list, set, tuple)) else value
+    for name, value in inputs.items()
+}
+
 with api_tab:
     st.caption("With API, you can do downstream task in FastAPI backend.")
     if st.button("Send POST JSON", disabled=bool(empty_args) and not allow_empty):
-        response = requests.post(API_URL, json=inputs)
+        response = requests.post(API_URL, json=json_inputs)
         if response.ok:
             st.json(response.json())
         else:
             st.error("Failed to get response from API")
 
     if st.button("Send GET Request", disabled=bool(empty_args) and not allow_empty):
-        response = requests.get(API_URL, params=inputs)
+        response = requests.get(API_URL, params=query_inputs)
         if response.ok:
             st.json(response.json())
         else:
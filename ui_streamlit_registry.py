@@ -0,0 +1,97 @@
+import streamlit as st
+from pydantic import PydanticUserError
+from utils import create_streamlit_ui
+from registry import TapRegistry
+import requests
+import os
+
+# FastAPI endpoint URL (of api_registry.py)
+API_URL = os.environ.get("API_BASE_URL", "http://127.0.0.1:8888") + "/taps"
+
+st.set_page_config("Streamlit Tap Registry")
+st.title("Streamlit Tap Registry")
+
+
+# Shared by all sessions, so generated models stay in one bounded cache
+@st.cache_resource
+def get_registry() -> TapRegistry:
+    return TapRegistry()
+
+
+registry = get_registry()
+
+with st.sidebar:
+    name = st.selectbox("Tap / Function", registry.names())
+    with st.expander("Cache"):
+        st.json(registry.cache_info())
+
+if name is None:
+    st.warning("No Tap class or typed function found in `TAP_REGISTRY_MODULES`.")
+    st.stop()
+
+allow_empty = st.checkbox("Allow Empty")
+
+st.divider()
+
+try:
+    tap_class_or_func = registry.load(name)
+except (ImportError, AttributeError, TypeError) as e:
+    st.error(f"Cannot load {name}: {e!r}")
+    st.stop()
+
+inputs, empty_args = create_streamlit_ui(
+    tap_class_or_func, required_warning=not allow_empty
+)
+
+local_tap, api_tab = st.tabs(["Local", "API"])
+
+
+with local_tap:
+    with st.expander("Pydantic Model"):
+        st.write("Pydantic Model Schema")
+        try:
+            st.json(registry.pydantic_model(name).model_json_schema())
+        except (PydanticUserError, NameError) as e:
+            st.error(f"Cannot build model for {name}: {e!r}")
+
+    st.write("Input Values")
+    st.write(inputs)
+
+    if not allow_empty and empty_args:
+        st.warning(
+            f"Missing {len(empty_args)} required arguments: {empty_args}. Fill to continue."
+        )
+
+with api_tab:
+    st.caption("With API, you can do downstream task in FastAPI backend.")
+    submit_url = f"{API_URL}/{name}/submit"
+    if st.button("Send POST JSON", disabled=bool(empty_args) and not allow_empty):
+        # Sets (and tuples) are not JSON serializable
+        response = requests.post(
+            submit_url,
+            json={
+                field: list(value) if isinstance(value, (set, tuple)) else value
+                for field, value in inputs.items()
+            },
+        )
+        if response.ok:
+            st.json(response.json())
+        else:
+            st.error("Failed to get response from API")
+
+    if st.button("Send GET Request", disabled=bool(empty_args) and not allow_empty):
+        response = requests.get(submit_url, params=inputs)
+        if response.ok:
+            st.json(response.json())
+        else:
+            st.error("Failed to get response from API")
+
+    if st.button("Send POST Form", disabled=bool(empty_args) and not allow_empty):
+        response = requests.post(f"{submit_url}-form", data=inputs)
+        if response.ok:
+            st.json(response.json())
+        else:
+            st.error("Failed to get response from API")
+
+    st.divider()
+    st.link_button("API Document", API_URL.rsplit("/", 1)[0] + "/docs")
@@ -12,7 +12,14 @@ from typing import (
 import streamlit as st
 from pydantic import create_model, BaseModel
 from tap import Tap
-from wtforms import StringField, IntegerField, BooleanField, SelectField, SubmitField
+from wtforms import (
+    StringField,
+    IntegerField,
+    FloatField,
+    BooleanField,
+    SelectField,
+    SubmitField,
+)
 from wtforms.validators import DataRequired, Optional
 from flask_wtf import FlaskForm
 import inspect
@@ -79,7 +86,7 @@ def _get_streamlit_input(
     elif get_origin(arg_type) is tuple:
         inner_types = get_args(arg_type)
         if len(inner_types) == 2 and inner_types[1] is ...:
-            return st.text_area(
+            text_area_result = st.text_area(
                 name,
                 value=", ".join(map(str, default if default else [])),
                 help=(
@@ -87,7 +94,9 @@ def _get_streamlit_input(
                     if is_required
                     else "(Items should be separated by `, `.)"
                 ),
-            ).split(", ")
+            )
+            # NOTE: "".split(", ") is ['']
+            return default if not text_area_result else text_area_result.split(", ")
         else:
             return tuple(
                 _get_streamlit_input(
@@ -168,11 +177,28 @@ def _parse_tap_obj(tap_obj: Tap) -> Dict[str, Tuple[Type, Any]]:
     return results
 
 
-def _parse_tap(tap_class_or_obj: Union[Type[Tap], Tap]) -> Dict[str, Tuple[Type, Any]]:
+def _parse_func(func: callable) -> Dict[str, Tuple[Type, Any]]:
+    results = {}
+    type_hints = get_type_hints(func)
+    for name, param in inspect.signature(func).parameters.items():
+        if name not in type_hints:
+            continue
+        is_required = param.default is inspect.Parameter.empty
+        default = None if is_required else param.default
+        results[name] = (type_hints[name], default, is_required)
+    return results
+
+
+def _parse_tap(
+    tap_class_or_obj: Union[Type[Tap], Tap, callable]
+) -> Dict[str, Tuple[Type, Any]]:
     if isinstance(tap_class_or_obj, type(Tap)):
         return _parse_tap_class(tap_class_or_obj)
     elif isinstance(tap_class_or_obj, Tap):
         return _parse_tap_obj(tap_class_or_obj)
+    elif callable(tap_class_or_obj):
+        # Typed function (the same ones `tapify` accepts)
+        return _parse_func(tap_class_or_obj)
     else:
         raise NotImplementedError(f"Unknown type {type(tap_class_or_obj)}.")
 
@@ -229,6 +255,9 @@ def _get_flask_input(
 
     # Handle Literal types (which are Enums or fixed choices)
     if get_origin(arg_type) is Literal:
+        if isinstance(get_args(arg_type)[0], bool):
+            # The submitted "True" string would never match a True choice
+            return BooleanField(name, default=default, validators=validators)
         choices = [(choice, choice) for choice in get_args(arg_type)]
         return SelectField(
             name, choices=choices, default=default, validators=validators
@@ -247,7 +276,7 @@ def _get_flask_input(
     elif arg_type is int:
         return IntegerField(name, default=default, validators=validators)
     elif arg_type is float:
-        return IntegerField(name, default=default, validators=validators)
+        return FloatField(name, default=default, validators=validators)
 
     return None
 